@@ -22,7 +22,7 @@ from homeassistant.util.json import load_json, save_json
 from .hue_api import (
     HueCreateUsernameView, HueAllLightsStateView, HueOneLightStateView,
     HueOneLightChangeView, HueStateView, HueConfigView)
-from .upnp import DescriptionXmlView, UPNPResponderThread
+from .upnp import DescriptionXmlView, UPNPResponder
 
 DOMAIN = 'emulated_hue'
 
@@ -98,7 +98,7 @@ def setup(hass, yaml_config):
     server.register_view(HueOneLightStateView(config))
     server.register_view(HueOneLightChangeView(config))
 
-    upnp_listener = UPNPResponderThread(
+    upnp_listener = UPNPResponder(
         config.host_ip_addr, config.listen_port,
         config.upnp_bind_multicast, config.advertise_ip,
         config.advertise_port)
@@ -112,7 +112,7 @@ def setup(hass, yaml_config):
     @asyncio.coroutine
     def start_emulated_hue_bridge(event):
         """Start the emulated hue bridge."""
-        upnp_listener.start()
+        yield from upnp_listener.async_start(hass.loop)
         yield from server.start()
         hass.bus.async_listen_once(
             EVENT_HOMEASSISTANT_STOP, stop_emulated_hue_bridge)
@@ -1,5 +1,6 @@
 """Provides a Hue API to control Home Assistant."""
 import asyncio
+import json
 import logging
 
 from aiohttp import web
@@ -9,6 +10,7 @@ from homeassistant.const import (
     ATTR_ENTITY_ID, SERVICE_TURN_OFF, SERVICE_TURN_ON, SERVICE_VOLUME_SET,
     SERVICE_OPEN_COVER, SERVICE_CLOSE_COVER, STATE_ON, STATE_OFF,
     HTTP_BAD_REQUEST, HTTP_NOT_FOUND, ATTR_SUPPORTED_FEATURES,
+    CONTENT_TYPE_JSON,
 )
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS, SUPPORT_BRIGHTNESS
@@ -150,11 +152,16 @@ class HueConfigView(HomeAssistantView):
         """Initialize the instance of the view."""
         self.config = config
 
+        # The bridge config is static, so serialize it once instead of
+        # rebuilding the dict and JSON payload on every request
+        self._json_body = json.dumps(
+            gen_config(config), sort_keys=True).encode('UTF-8')
+
     @core.callback
     def get(self, request, username):
         """Handle a GET request."""
-        config = gen_config(self.config)
-        return self.json(config)
+        return web.Response(
+            body=self._json_body, content_type=CONTENT_TYPE_JSON)
 
 
 class HueStateView(HomeAssistantView):
@@ -168,6 +175,11 @@ class HueStateView(HomeAssistantView):
         """Initialize the instance of the view."""
         self.config = config
 
+        # The bridge config part of the state is static; build it once
+        # instead of formatting the friendly name and rebuilding the
+        # dict for every request
+        self._config_payload = gen_config(config)
+
     @asyncio.coroutine
     def get(self, request, username):
         """Process a request to get the list of available lights."""
@@ -178,7 +190,7 @@ class HueStateView(HomeAssistantView):
         data = {
             'lights': lights,
             'schedules': {},
-            'config': gen_config(self.config),
+            'config': self._config_payload,
             'groups': {},
             'scenes': {},
         }
@@ -1,8 +1,7 @@
 """Provides a UPNP discovery method that mimics Hue hubs."""
-import threading
+import asyncio
 import socket
 import logging
-import select
 
 from aiohttp import web
 
@@ -13,6 +12,12 @@ from .hue_api import BRIDGE_FRIENDLY_NAME_TEMPLATE
 
 _LOGGER = logging.getLogger(__name__)
 
+# SSDP multicast group address, packed once for IP_ADD_MEMBERSHIP
+_SSDP_GROUP = socket.inet_aton("239.255.255.250")
+
+# Byte needle matched against every received datagram
+_MSEARCH = b"M-SEARCH"
+
 
 class DescriptionXmlView(HomeAssistantView):
     """Handles requests for the description.xml file."""
@@ -25,9 +30,6 @@ class DescriptionXmlView(HomeAssistantView):
         """Initialize the instance of the view."""
         self.config = config
 
-    @core.callback
-    def get(self, request):
-        """Handle a GET request."""
         xml_template = """<?xml version="1.0" encoding="UTF-8" ?>
 <root xmlns="urn:schemas-upnp-org:device-1-0">
 <specVersion>
@@ -50,26 +52,55 @@ class DescriptionXmlView(HomeAssistantView):
 </root>
 """
 
-        friendly_name = BRIDGE_FRIENDLY_NAME_TEMPLATE.format(c=self.config)
+        friendly_name = BRIDGE_FRIENDLY_NAME_TEMPLATE.format(c=config)
 
-        resp_text = xml_template.format(c=self.config, friendly_name=friendly_name)
+        # The config is fixed for the lifetime of the view, so render
+        # the response body once instead of on every discovery probe
+        self._body = xml_template.format(
+            c=config, friendly_name=friendly_name).encode('utf-8')
 
-        return web.Response(text=resp_text, content_type='text/xml')
+    @core.callback
+    def get(self, request):
+        """Handle a GET request."""
+        return web.Response(body=self._body, content_type='text/xml')
 
 
-class UPNPResponderThread(threading.Thread):
-    """Handle responding to UPNP/SSDP discovery requests."""
+class SSDPResponderProtocol(asyncio.DatagramProtocol):
+    """Reply to SSDP M-SEARCH probes from the event loop."""
+
+    def __init__(self, upnp_response):
+        """Initialize the protocol."""
+        self.transport = None
+        self._upnp_response = upnp_response
+
+    def connection_made(self, transport):
+        """Keep the transport so replies reuse the listening socket."""
+        self.transport = transport
 
-    _interrupted = False
+    def datagram_received(self, data, addr):
+        """Respond to M-SEARCH discovery probes with our info."""
+        if _MSEARCH in data:
+            self.transport.sendto(self._upnp_response, addr)
+
+    def error_received(self, exc):
+        """Log socket errors."""
+        _LOGGER.error("UPNP Responder socket exception occurred: %s", exc)
+
+    def connection_lost(self, exc):
+        """Log the socket closure."""
+        _LOGGER.info("UPNP responder shutting down.")
+
+
+class UPNPResponder(object):
+    """Handle responding to UPNP/SSDP discovery requests."""
 
     def __init__(self, host_ip_addr, listen_port, upnp_bind_multicast,
                  advertise_ip, advertise_port):
         """Initialize the class."""
-        threading.Thread.__init__(self)
-
         self.host_ip_addr = host_ip_addr
         self.listen_port = listen_port
         self.upnp_bind_multicast = upnp_bind_multicast
+        self._transport = None
 
         # Note that the double newline at the end of
         # this string is required per the SSDP spec
@@ -88,8 +119,13 @@ USN: uuid:Socket-1_0-221438K0100073::urn:schemas-upnp-org:device:basic:1
             advertise_ip, advertise_port).replace("\n", "\r\n") \
                                          .encode('utf-8')
 
-    def run(self):
-        """Run the server."""
+    @asyncio.coroutine
+    def async_start(self, loop):
+        """Register the SSDP endpoint on the event loop.
+
+        Runs on the hass event loop and shares its selector instead of
+        parking a dedicated thread in a blocking wait.
+        """
         # Listen for UDP port 1900 packets sent to SSDP multicast address
         ssdp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         ssdp_socket.setblocking(False)
@@ -105,57 +141,19 @@ USN: uuid:Socket-1_0-221438K0100073::urn:schemas-upnp-org:device:basic:1
         ssdp_socket.setsockopt(
             socket.SOL_IP,
             socket.IP_ADD_MEMBERSHIP,
-            socket.inet_aton("239.255.255.250") +
-            socket.inet_aton(self.host_ip_addr))
+            _SSDP_GROUP + socket.inet_aton(self.host_ip_addr))
 
         if self.upnp_bind_multicast:
             ssdp_socket.bind(("", 1900))
         else:
             ssdp_socket.bind((self.host_ip_addr, 1900))
 
-        while True:
-            if self._interrupted:
-                clean_socket_close(ssdp_socket)
-                return
-
-            try:
-                read, _, _ = select.select(
-                    [ssdp_socket], [],
-                    [ssdp_socket], 2)
-
-                if ssdp_socket in read:
-                    data, addr = ssdp_socket.recvfrom(1024)
-                else:
-                    # most likely the timeout, so check for interrupt
-                    continue
-            except socket.error as ex:
-                if self._interrupted:
-                    clean_socket_close(ssdp_socket)
-                    return
-
-                _LOGGER.error("UPNP Responder socket exception occurred: %s",
-                              ex.__str__)
-                # without the following continue, a second exception occurs
-                # because the data object has not been initialized
-                continue
-
-            if "M-SEARCH" in data.decode('utf-8', errors='ignore'):
-                # SSDP M-SEARCH method received, respond to it with our info
-                resp_socket = socket.socket(
-                    socket.AF_INET, socket.SOCK_DGRAM)
-
-                resp_socket.sendto(self.upnp_response, addr)
-                resp_socket.close()
+        self._transport, _ = yield from loop.create_datagram_endpoint(
+            lambda: SSDPResponderProtocol(self.upnp_response),
+            sock=ssdp_socket)
 
     def stop(self):
-        """Stop the server."""
-        # Request for server
-        self._interrupted = True
-        self.join()
-
-
-def clean_socket_close(sock):
-    """Close a socket connection and logs its closure."""
-    _LOGGER.info("UPNP responder shutting down.")
-
-    sock.close()
+        """Stop listening for discovery requests."""
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
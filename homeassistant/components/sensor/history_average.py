@@ -6,7 +6,6 @@ https://home-assistant.io/components/sensor.history_average/
 """
 import asyncio
 from operator import attrgetter
-from collections import defaultdict
 import logging
 import voluptuous as vol
 
@@ -24,6 +23,8 @@ import homeassistant.util.dt as dt_util
 
 _LOGGER = logging.getLogger(__name__)
 
+REQUIREMENTS = ['numpy==1.13.3']
+
 DOMAIN = 'history_average'
 DEPENDENCIES = ['history']
 
@@ -148,6 +149,10 @@ class HistoryAverageSensor(Entity):
         self._history = []
         self._state = 0
 
+        # cache of last rendered template string -> parsed datetime
+        self._start_cache = (None, None)
+        self._end_cache = (None, None)
+
     @asyncio.coroutine
     def async_added_to_hass(self):
         """Initialize data and register callbacks."""
@@ -198,26 +203,23 @@ class HistoryAverageSensor(Entity):
     @property
     def device_state_attributes(self):
         """Return the state attributes of the sensor."""
-        def period_in_seconds(period):
-            """Get the period period duration in seconds."""
-            if len(period) != 2 or period[0] == period[1]:
-                return 0.0
-            return (period[1] - period[0]).total_seconds()
-
-        def pretty_duration(period):
-            """Format a duration in days, hours, minutes, seconds."""
-            seconds = period_in_seconds(period)
-            days, seconds = divmod(seconds, 86400)
-            hours, seconds = divmod(seconds, 3600)
-            minutes, seconds = divmod(seconds, 60)
-            if days > 0:
-                return '%dd %dh %dm' % (days, hours, minutes)
-            elif hours > 0:
-                return '%dh %dm' % (hours, minutes)
-            return '%dm' % minutes
+        # Format the period duration as days, hours, minutes using
+        # integer arithmetic throughout
+        start, end = self._period
+        seconds = int((end - start).total_seconds())
+        days, seconds = divmod(seconds, 86400)
+        hours, seconds = divmod(seconds, 3600)
+        minutes = seconds // 60
+
+        if days > 0:
+            duration = '%dd %dh %dm' % (days, hours, minutes)
+        elif hours > 0:
+            duration = '%dh %dm' % (hours, minutes)
+        else:
+            duration = '%dm' % minutes
 
         return {
-            ATTR_DURATION: pretty_duration(self._period),
+            ATTR_DURATION: duration,
         }
 
     @property
@@ -228,12 +230,14 @@ class HistoryAverageSensor(Entity):
     @asyncio.coroutine
     def async_update(self):
         """Update the sensor's state."""
+        import numpy as np
+
         # clean up history & update period
         yield from self.asysnc_trim_history()
         start, end = self._period
 
-        _LOGGER.info(" - period start: %s", start)
-        _LOGGER.info(" - period end  : %s", end)
+        _LOGGER.debug(" - period start: %s", start)
+        _LOGGER.debug(" - period end  : %s", end)
         now = dt_util.utcnow()
 
         # Compute timestamps
@@ -241,44 +245,53 @@ class HistoryAverageSensor(Entity):
         end_timestamp = dt_util.as_timestamp(end)
         now_timestamp = dt_util.as_timestamp(now)
 
-        last_state = None
-        last_time = None
-        total_elapsed = 0
-        intervals = defaultdict(float)
+        # Collect the numeric states within the period. Bind the
+        # globals used on every iteration to locals so the loop runs
+        # on LOAD_FAST instead of repeated global/attribute lookups.
+        items = []
+        append = items.append
+        _float = float
 
-        # Sum time spent in each state
         for item in self._history:
-            current_state = item.state
             current_time = item.last_changed.timestamp()
 
             # don't include values not within the period
             if end_timestamp <= current_time:
                 break
 
-            # Average over valid states
-            if last_state is not None:
-                if last_time < start_timestamp:
-                    last_time = start_timestamp
-                elapsed = current_time - last_time
-                total_elapsed += elapsed
-                intervals[float(last_state)] += elapsed
+            try:
+                current_state = _float(item.state)
+            except ValueError:
+                # skip states that aren't numeric, e.g. 'unknown'
+                continue
+
+            append((current_state, current_time))
+
+        if not items:
+            self._state = 0
+            return
 
-            last_time = current_time
-            last_state = current_state
+        states = np.fromiter(
+            (state for state, _ in items),
+            dtype=np.float64, count=len(items))
+        times = np.fromiter(
+            (time for _, time in items),
+            dtype=np.float64, count=len(items))
 
-        # Count time elapsed between last history state and end of measure
-        if last_state is not None:
-            measure_end = min(end_timestamp, now_timestamp)
-            elapsed = measure_end - last_time
-            total_elapsed += elapsed
-            intervals[float(last_state)] += elapsed
+        # Each state lasts until the next change; the last one lasts
+        # until the end of the measure. Clamp the item the trim keeps
+        # from before the period to the period start.
+        times = np.clip(times, start_timestamp, None)
+        times = np.append(times, min(end_timestamp, now_timestamp))
 
-        # Calculate the weighted average
-        updated_state = 0
-        for state in intervals:
-            updated_state += float(state) * (intervals[state] / total_elapsed)
+        # Weight each state by the time spent in it
+        elapsed = np.diff(times)
+        total_elapsed = elapsed.sum()
 
-        self._state = round(updated_state, 2)
+        updated_state = \
+            np.dot(states, elapsed) / total_elapsed if total_elapsed else 0
+
+        self._state = round(float(updated_state), 2)
 
     @asyncio.coroutine
     def async_update_period(self):
@@ -303,15 +316,23 @@ class HistoryAverageSensor(Entity):
             except (TemplateError, TypeError) as ex:
                 handle_template_exception(ex, 'start')
                 return
-            start = dt_util.parse_datetime(start_rendered)
 
-            if start is None:
-                try:
-                    start = dt_util.utc_from_timestamp(float(start_rendered))
-                except ValueError:
-                    _LOGGER.error("Parsing error: start must be a datetime"
-                                  "or a timestamp")
-                    return
+            # skip re-parsing when the template rendered the same string
+            if start_rendered == self._start_cache[0]:
+                start = self._start_cache[1]
+            else:
+                start = dt_util.parse_datetime(start_rendered)
+
+                if start is None:
+                    try:
+                        start = dt_util.utc_from_timestamp(
+                            float(start_rendered))
+                    except ValueError:
+                        _LOGGER.error("Parsing error: start must be a datetime"
+                                      "or a timestamp")
+                        return
+
+                self._start_cache = (start_rendered, start)
 
         # Parse end
         if self._end is not None:
@@ -320,14 +341,20 @@ class HistoryAverageSensor(Entity):
             except (TemplateError, TypeError) as ex:
                 handle_template_exception(ex, 'end')
                 return
-            end = dt_util.parse_datetime(end_rendered)
-            if end is None:
-                try:
-                    end = dt_util.utc_from_timestamp(float(end_rendered))
-                except ValueError:
-                    _LOGGER.error("Parsing error: end must be a datetime "
-                                  "or a timestamp")
-                    return
+
+            if end_rendered == self._end_cache[0]:
+                end = self._end_cache[1]
+            else:
+                end = dt_util.parse_datetime(end_rendered)
+                if end is None:
+                    try:
+                        end = dt_util.utc_from_timestamp(float(end_rendered))
+                    except ValueError:
+                        _LOGGER.error("Parsing error: end must be a datetime "
+                                      "or a timestamp")
+                        return
+
+                self._end_cache = (end_rendered, end)
 
         # Calculate start or end using the duration
         if start is None:
@@ -7,6 +7,8 @@ https://home-assistant.io/components/sensor.history_stats/
 import datetime
 import logging
 import math
+import threading
+from time import monotonic
 
 import voluptuous as vol
 
@@ -46,6 +48,67 @@ ICON = 'mdi:chart-line'
 
 ATTR_VALUE = 'value'
 
+# Recently fetched history, keyed by entity id and second-granularity
+# period: (entity_id, start, end) -> (expiry, result)
+_HISTORY_CACHE = {}
+_HISTORY_CACHE_TTL = 1.0
+_HISTORY_CACHE_LOCK = threading.Lock()
+
+# Fetches currently in flight: key -> Event set once the result lands
+_HISTORY_INFLIGHT = {}
+
+
+def _state_changes_during_period(hass, start, end, entity_id):
+    """Fetch state history, deduplicating queries across sensors.
+
+    Several sensors watching the same entity over the same
+    second-granularity window share one recorder query per TTL
+    instead of hitting the database once each. Sensors on different
+    entities or windows keep querying in parallel: the global lock
+    only guards the dict bookkeeping, never the recorder query.
+    """
+    key = (entity_id,
+           int(dt_util.as_timestamp(start)),
+           int(dt_util.as_timestamp(end)))
+
+    while True:
+        with _HISTORY_CACHE_LOCK:
+            cached = _HISTORY_CACHE.get(key)
+            if cached is not None and monotonic() < cached[0]:
+                return cached[1]
+
+            fetch_done = _HISTORY_INFLIGHT.get(key)
+            if fetch_done is None:
+                # no fetch under way for this key, so it's ours
+                fetch_done = threading.Event()
+                _HISTORY_INFLIGHT[key] = fetch_done
+                break
+
+        # Another sensor is already querying this key; wait for it to
+        # finish, then re-check the cache
+        fetch_done.wait()
+
+    try:
+        result = history.state_changes_during_period(
+            hass, start, end, entity_id)
+
+        with _HISTORY_CACHE_LOCK:
+            now = monotonic()
+
+            # evict anything expired so the cache can't grow without bound
+            for stale in [k for k, v in _HISTORY_CACHE.items()
+                          if v[0] <= now]:
+                del _HISTORY_CACHE[stale]
+
+            _HISTORY_CACHE[key] = (now + _HISTORY_CACHE_TTL, result)
+
+        return result
+    finally:
+        # On failure no result is cached and a woken waiter retries
+        with _HISTORY_CACHE_LOCK:
+            del _HISTORY_INFLIGHT[key]
+        fetch_done.set()
+
 
 def exactly_two_period_keys(conf):
     """Ensure exactly 2 of CONF_PERIOD_KEYS are provided."""
@@ -181,12 +244,13 @@ class HistoryStatsSensor(Entity):
         p_end = dt_util.as_utc(p_end)
         now = datetime.datetime.now()
 
-        # Compute integer timestamps
-        start_timestamp = math.floor(dt_util.as_timestamp(start))
-        end_timestamp = math.floor(dt_util.as_timestamp(end))
-        p_start_timestamp = math.floor(dt_util.as_timestamp(p_start))
-        p_end_timestamp = math.floor(dt_util.as_timestamp(p_end))
-        now_timestamp = math.floor(dt_util.as_timestamp(now))
+        # Compute integer timestamps; int() truncation equals floor
+        # for these non-negative values and skips the math module
+        start_timestamp = int(dt_util.as_timestamp(start))
+        end_timestamp = int(dt_util.as_timestamp(end))
+        p_start_timestamp = int(dt_util.as_timestamp(p_start))
+        p_end_timestamp = int(dt_util.as_timestamp(p_end))
+        now_timestamp = int(dt_util.as_timestamp(now))
 
         # If period has not changed and current time after the period end...
         if start_timestamp == p_start_timestamp and \
@@ -196,7 +260,7 @@ class HistoryStatsSensor(Entity):
             return
 
         # Get history between start and end
-        history_list = history.state_changes_during_period(
+        history_list = _state_changes_during_period(
             self.hass, start, end, str(self._entity_id))
 
         if self._entity_id not in history_list.keys():
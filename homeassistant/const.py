@@ -5,7 +5,7 @@ MINOR_VERSION = 60
 PATCH_VERSION = '0.dev0'
 __short_version__ = '{}.{}'.format(MAJOR_VERSION, MINOR_VERSION)
 __version__ = '{}.{}'.format(__short_version__, PATCH_VERSION)
-REQUIRED_PYTHON_VER = (3, 4, 2)
+REQUIRED_PYTHON_VER = (3, 4, 4)
 REQUIRED_PYTHON_VER_WIN = (3, 5, 2)
 CONSTRAINT_FILE = 'package_constraints.txt'
 
@@ -10,6 +10,11 @@ import io
 import codecs
 import functools
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -19,8 +24,15 @@ def load_json(filename: str, **kwargs) -> Union[List, Dict]:
     Defaults to returning empty dict if file is not found.
     """
     try:
-        with open(filename, 'r') as fh:
-            data = json.load(fh, **kwargs)
+        # binary mode skips the text-layer decode; both parsers
+        # accept utf-8 bytes directly
+        with open(filename, 'rb') as fh:
+            raw = fh.read()
+
+        if orjson is not None and not kwargs:
+            data = orjson.loads(raw)
+        else:
+            data = json.loads(raw, **kwargs)
     # This is not a fatal error
     except FileNotFoundError:
         _LOGGER.debug('File not found: %r; Pretending it just contained an empty mapping I guess.' % filename)
@@ -34,12 +46,41 @@ def save_json(filename: str, data: Union[List, Dict], sort_keys: bool=True, inde
 
     Just like `write()` returns the number of bytes written.
     """
-    json_data = json.dumps(data, sort_keys=sort_keys, indent=indent, **kwargs)
+    if orjson is not None and not kwargs:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        if indent:
+            # orjson only knows a 2-space indent
+            option |= orjson.OPT_INDENT_2
+        json_data = orjson.dumps(data, option=option)
+    else:
+        json_data = json.dumps(
+            data, sort_keys=sort_keys, indent=indent, **kwargs
+        ).encode('utf-8')
+
+    tmp_file = tempfile.NamedTemporaryFile(
+        'wb', dir=os.path.dirname(filename) or '.', delete=False)
+    try:
+        cnt = tmp_file.write(json_data)
+        tmp_file.flush()
+        os.fsync(tmp_file.fileno())
+        tmp_file.close()
+
+        # carry over the destination's mode: the temp file is created
+        # 0600 and the rename would otherwise install that over files
+        # whose permissions the old rewrite-in-place preserved
+        try:
+            os.chmod(tmp_file.name, os.stat(filename).st_mode)
+        except FileNotFoundError:
+            pass
 
-    with open(filename, 'w+') as fh:
-        fh.seek(0)
-        cnt = fh.write(json_data)
-        fh.truncate()
+        # the rename is atomic, so a crash mid-write can't leave a
+        # half-written file behind
+        os.replace(tmp_file.name, filename)
+    except Exception:
+        tmp_file.close()
+        if os.path.exists(tmp_file.name):
+            os.unlink(tmp_file.name)
+        raise
 
     return cnt
 
@@ -36,7 +36,7 @@ def hass_hue(loop, hass):
         {http.DOMAIN: {http.CONF_SERVER_PORT: HTTP_SERVER_PORT}}))
 
     with patch('homeassistant.components'
-               '.emulated_hue.UPNPResponderThread'):
+               '.emulated_hue.UPNPResponder'):
         loop.run_until_complete(
             setup.async_setup_component(hass, emulated_hue.DOMAIN, {
                 emulated_hue.DOMAIN: {
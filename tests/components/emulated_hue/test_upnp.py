@@ -63,7 +63,7 @@ class TestEmulatedHue(unittest.TestCase):
             {http.DOMAIN: {http.CONF_SERVER_PORT: HTTP_SERVER_PORT}})
 
         with patch('homeassistant.components'
-                   '.emulated_hue.UPNPResponderThread'):
+                   '.emulated_hue.UPNPResponder'):
             setup.setup_component(hass, emulated_hue.DOMAIN, {
                 emulated_hue.DOMAIN: {
                     emulated_hue.CONF_LISTEN_PORT: BRIDGE_SERVER_PORT
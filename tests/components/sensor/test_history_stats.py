@@ -5,6 +5,7 @@ import unittest
 from unittest.mock import patch
 
 from homeassistant.setup import setup_component
+from homeassistant.components.sensor import history_stats
 from homeassistant.components.sensor.history_stats import HistoryStatsSensor
 import homeassistant.core as ha
 from homeassistant.helpers.template import Template
@@ -136,6 +137,35 @@ class TestHistoryStatsSensor(unittest.TestCase):
         self.assertEqual(sensor3.state, 2)
         self.assertEqual(sensor4.state, 50)
 
+    def test_measure_shares_history_query(self):
+        """Test sensors on the same entity and window share one query."""
+        fake_states = {
+            'binary_sensor.test_id': []
+        }
+
+        # Fixed timestamps so every sensor resolves the same period
+        start = Template('{{ 1234567890 }}', self.hass)
+        end = Template('{{ 1234571490 }}', self.hass)
+
+        sensors = [
+            HistoryStatsSensor(
+                self.hass, 'binary_sensor.test_id', 'on', start, end, None,
+                'time', 'Test{}'.format(i))
+            for i in range(3)
+        ]
+
+        history_stats._HISTORY_CACHE.clear()
+
+        with patch('homeassistant.components.history.'
+                   'state_changes_during_period',
+                   return_value=fake_states) as mock_query:
+            with patch('homeassistant.components.history.get_state',
+                       return_value=None):
+                for sensor in sensors:
+                    sensor.update()
+
+        self.assertEqual(mock_query.call_count, 1)
+
     def test_wrong_date(self):
         """Test when start or end value is not a timestamp or a date."""
         good = Template('{{ now() }}', self.hass)
@@ -0,0 +1,82 @@
+"""Test Home Assistant json utility functions."""
+import os
+import stat
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from homeassistant.util import json as json_util
+
+TEST_DATA = {'a': [1, 2], 'b': 'c'}
+
+
+class TestJsonUtil(unittest.TestCase):
+    """Test the JSON utility functions."""
+
+    def setUp(self):
+        """Set up a scratch directory for the saved files."""
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up the scratch directory."""
+        for fname in os.listdir(self.tmp_dir):
+            os.remove(os.path.join(self.tmp_dir, fname))
+        os.rmdir(self.tmp_dir)
+
+    def _path_for(self, name):
+        """Return a test path inside the scratch directory."""
+        return os.path.join(self.tmp_dir, name)
+
+    def test_save_and_load(self):
+        """Test saving and loading back round trips."""
+        fname = self._path_for('test1.json')
+        json_util.save_json(fname, TEST_DATA)
+        self.assertEqual(json_util.load_json(fname), TEST_DATA)
+
+    def test_save_and_load_without_orjson(self):
+        """Test the stdlib fallback used when orjson is unavailable."""
+        fname = self._path_for('test2.json')
+        with patch.object(json_util, 'orjson', None):
+            json_util.save_json(fname, TEST_DATA)
+            self.assertEqual(json_util.load_json(fname), TEST_DATA)
+
+        # both serializers must produce output the other can read
+        self.assertEqual(json_util.load_json(fname), TEST_DATA)
+
+    def test_save_with_encoder_kwargs(self):
+        """Test encoder kwargs like default= fall back to stdlib json."""
+        fname = self._path_for('test3.json')
+        json_util.save_json(fname, {'data': {1}}, default=list)
+        self.assertEqual(json_util.load_json(fname), {'data': [1]})
+
+    def test_load_missing_file(self):
+        """Test loading a missing file returns an empty dict."""
+        self.assertEqual(json_util.load_json(self._path_for('none.json')), {})
+
+    def test_overwrite_keeps_mode(self):
+        """Test saving over an existing file preserves its permissions."""
+        fname = self._path_for('test4.json')
+        with open(fname, 'w') as fh:
+            fh.write('not even json')
+        os.chmod(fname, 0o644)
+
+        json_util.save_json(fname, TEST_DATA)
+
+        self.assertEqual(json_util.load_json(fname), TEST_DATA)
+        self.assertEqual(stat.S_IMODE(os.stat(fname).st_mode), 0o644)
+
+        # the atomic save must not leave temp files behind
+        self.assertEqual(os.listdir(self.tmp_dir), ['test4.json'])
+
+    def test_failed_save_cleans_up(self):
+        """Test a failed save removes its temp file and keeps the target."""
+        fname = self._path_for('test5.json')
+        json_util.save_json(fname, TEST_DATA)
+
+        with patch.object(json_util.os, 'replace',
+                          side_effect=OSError('no space left on device')):
+            self.assertRaises(
+                OSError, json_util.save_json, fname, {'other': 1})
+
+        self.assertEqual(os.listdir(self.tmp_dir), ['test5.json'])
+        self.assertEqual(json_util.load_json(fname), TEST_DATA)